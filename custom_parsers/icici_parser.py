@@ -1,7 +1,593 @@
+import os
+import re
+import hashlib
+import importlib
+import importlib.util
+import logging
+import multiprocessing
+import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from itertools import chain
+from operator import itemgetter
+from pathlib import Path
+
 import pdfplumber
+import pypdfium2 as pdfium
+from pdfminer.psparser import PSException
 import pandas as pd
 import numpy as np
 
+try:
+    from pdfplumber.utils.exceptions import MalformedPDFException, PdfminerException
+    PDFPLUMBER_ERRORS = (MalformedPDFException, PdfminerException)
+except ImportError:  # pdfplumber < 0.11.6 raises pdfminer's errors unwrapped
+    PDFPLUMBER_ERRORS = ()
+
+try:
+    import pymupdf
+    # Damaged files raise RuntimeError subclasses, deeper MuPDF calls FzErrorBase
+    PYMUPDF_ERRORS = (RuntimeError, ValueError, OSError, getattr(pymupdf.mupdf, 'FzErrorBase', RuntimeError))
+except ImportError:  # Optional C-backed table extraction
+    pymupdf = None
+    PYMUPDF_ERRORS = ()
+
+try:
+    from numba import njit
+except ImportError:  # Optional compiled amount parsing
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+# Modules exposing pdfplumber's open/pages/extract_tables API, selectable via
+# ICICI_PARSER_BACKEND. pdfplumber-rs installs itself under the pdfplumber name,
+# so it needs no entry here.
+TABLE_BACKENDS = ("pdfplumber", "ripdoc")
+
+def _load_table_backend():
+    """
+    Returns the module used for the per-page table extraction fallback.
+
+    ICICI_PARSER_BACKEND may name one of TABLE_BACKENDS; pdfplumber is used
+    when it is unset, unknown, or not installed.
+    """
+    name = os.environ.get("ICICI_PARSER_BACKEND", "pdfplumber")
+    if name not in TABLE_BACKENDS:
+        return pdfplumber
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return pdfplumber
+
+table_backend = _load_table_backend()
+
+# Statement tables are ruled, so only line-based detection is needed
+TABLE_SETTINGS = {
+    "vertical_strategy": "lines",
+    "horizontal_strategy": "lines",
+    "snap_tolerance": 3,
+}
+
+# Parsed results are cached as parquet, keyed by the PDF's SHA-256 and SOURCE_DIGEST
+CACHE_DIR = Path.home() / ".cache" / "icici_parser"
+
+def _source_digest():
+    """
+    Fingerprints the code producing parse() output: this module's source and
+    the pandas version.
+
+    Returns:
+        A short hex digest, or None when the module was exec'd without a
+        source file, in which case results are not cached.
+    """
+    source_path = globals().get('__file__')
+    if not source_path:
+        return None
+    try:
+        source = Path(source_path).read_bytes()
+    except OSError:
+        return None
+    return hashlib.sha256(source + pd.__version__.encode()).hexdigest()[:16]
+
+SOURCE_DIGEST = _source_digest()
+
+EXPECTED_COLUMNS = ['Date', 'Description', 'Debit Amt', 'Credit Amt', 'Balance']
+
+# Errors meaning the PDF could not be read, as opposed to bugs in this module
+PDF_ERRORS = (
+    OSError,
+    ValueError,
+    pdfium.PdfiumError,
+    PSException,
+    BrokenProcessPool,
+) + PDFPLUMBER_ERRORS
+
+# Tables whose header lacks any of these are not transaction tables
+EXPECTED_HEADER = frozenset(EXPECTED_COLUMNS)
+
+# parse() returns exactly this many rows, so extraction stops once they are read
+MAX_ROWS = 100
+
+TEXT_COLUMNS = ['Date', 'Description']
+
+AMOUNT_COLUMNS = ['Debit Amt', 'Credit Amt', 'Balance']
+
+def _text_dtype():
+    """
+    Returns the dtype for the text columns.
+
+    Where pandas infers strings as StringDtype (pandas 3, or
+    future.infer_string), this is that dtype, Arrow-backed when pyarrow is
+    installed, so the output still compares equal to read_csv results.
+    Older pandas gets object.
+    """
+    try:
+        if pd.get_option("future.infer_string"):
+            return pd.StringDtype(na_value=np.nan)
+    except (KeyError, TypeError):
+        pass  # Option or na_value argument not available on this pandas
+    return object
+
+TEXT_DTYPE = _text_dtype()
+
+# Transaction rows start with a DD-MM-YYYY date
+DATE_ROW_PATTERN = re.compile(r"^\d{2}-\d{2}-\d{4}\b", re.M)
+
+def _extract_page_table_fast(page):
+    """
+    Rebuilds the transaction table of a pypdfium2 page from its text layer.
+
+    Text segments are grouped into lines by vertical position, and each cell
+    is assigned to the header column whose centre is nearest, so empty
+    Debit/Credit cells stay in the right place.
+
+    Returns:
+        A tuple of (table, text) where table is a list of rows (header
+        first), or None if a cell wraps onto extra lines and the rows cannot
+        be rebuilt from the text layer, and text is the page's full text.
+    """
+    textpage = page.get_textpage()
+    text = textpage.get_text_range().replace("\r\n", "\n")
+
+    segments = []
+    for i in range(textpage.count_rects()):
+        left, bottom, right, top = textpage.get_rect(i)
+        cell = textpage.get_text_bounded(left, bottom, right, top).strip()
+        segments.append((top, bottom, (left + right) / 2, cell))
+
+    lines = []
+    for top, bottom, center, cell in sorted(segments, key=lambda segment: (-segment[0], segment[2])):
+        if lines and top > lines[-1]['bottom']:
+            lines[-1]['bottom'] = max(lines[-1]['bottom'], bottom)
+            lines[-1]['cells'].append((center, cell, top))
+        else:
+            lines.append({'top': top, 'bottom': bottom, 'cells': [(center, cell, top)]})
+    for line in lines:
+        line['cells'].sort()
+
+    dated = [i for i, line in enumerate(lines) if DATE_ROW_PATTERN.match(line['cells'][0][1])]
+    if not dated or dated[0] == 0:
+        return [], text
+
+    # Wrapped cells leave undated lines between transaction rows, or just below the
+    # last one, closer to it than rows are to each other
+    first, last = dated[0], dated[-1]
+    if last - first + 1 != len(dated):
+        return None, text
+    row_pitch = min((lines[a]['top'] - lines[b]['top'] for a, b in zip(dated, dated[1:])), default=None)
+    if row_pitch is not None and last + 1 < len(lines) and lines[last]['top'] - lines[last + 1]['top'] < row_pitch:
+        return None, text
+
+    header = lines[first - 1]['cells']
+    centers = [center for center, _, _ in header]
+    table = [[cell for _, cell, _ in header]]
+    for line in lines[first:last + 1]:
+        row = [''] * len(centers)
+        row_tops = [None] * len(centers)
+        for center, cell, top in line['cells']:
+            col = min(range(len(centers)), key=lambda c: abs(centers[c] - center))
+            # Two baselines in one cell means the cell wrapped within the merged line
+            if row_tops[col] is not None and abs(row_tops[col] - top) > 1:
+                return None, text
+            row_tops[col] = top
+            row[col] = f"{row[col]} {cell}".strip()
+        table.append(row)
+
+    return table, text
+
+def _extract_rows_fast(pdf_path: str):
+    """
+    Extracts the transaction rows of each page using PDFium, stopping once
+    MAX_ROWS rows have been collected.
+
+    Returns:
+        A list with the rows of each page read, or None if a page has wrapped
+        cells, yielded fewer transaction rows than dated lines, or no rows
+        were found, in which case pdfplumber should be used.
+    """
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        page_rows = []
+        total_rows = 0
+        for page in pdf:
+            table, text = _extract_page_table_fast(page)
+            if table is None:
+                return None
+
+            # Every dated line must survive header matching as a transaction row
+            page_rows.append(_transaction_rows([table] if len(table) > 1 else []))
+            if len(page_rows[-1]) < len(DATE_ROW_PATTERN.findall(text)):
+                return None
+            total_rows += len(page_rows[-1])
+            if total_rows >= MAX_ROWS:
+                break
+    finally:
+        pdf.close()
+
+    return page_rows if total_rows else None
+
+def _extract_rows_pymupdf(pdf_path: str):
+    """
+    Extracts the transaction rows of each page using PyMuPDF's table finder,
+    stopping once MAX_ROWS rows have been collected.
+
+    Returns:
+        A list with the rows of each page read, or None if PyMuPDF failed or
+        found no rows.
+    """
+    try:
+        with pymupdf.open(pdf_path) as doc:
+            page_rows = []
+            total_rows = 0
+            for page in doc:
+                tables = [table.extract() for table in page.find_tables(strategy="lines_strict").tables]
+                page_rows.append(_transaction_rows(tables))
+                total_rows += len(page_rows[-1])
+                if total_rows >= MAX_ROWS:
+                    break
+    except PYMUPDF_ERRORS:
+        logger.warning("PyMuPDF could not read %s, falling back to pdfplumber", pdf_path, exc_info=True)
+        return None
+
+    return page_rows if total_rows else None
+
+# Amount cells are parsed from NUL-padded byte slots of this width
+MONEY_WIDTH = 16
+
+def _parse_money_kernel(buf, out):
+    """
+    Parses fixed-width ASCII amount slots into out, in place.
+
+    Each slot holds an optional leading '-', digits with optional thousands
+    commas, and an optional '.' followed by fraction digits. Empty slots
+    become NaN.
+
+    Returns:
+        False as soon as a slot holds anything else, so the caller can fall
+        back to pandas; True otherwise.
+    """
+    for i in range(buf.shape[0]):
+        value = 0.0
+        scale = 1.0
+        sign = 1.0
+        length = 0
+        digits = 0
+        seen_dot = False
+        for j in range(buf.shape[1]):
+            c = buf[i, j]
+            if c == 0:
+                break
+            length += 1
+            if 48 <= c <= 57:
+                # Horner's method; fraction digits are scaled once at the end
+                value = value * 10.0 + (c - 48)
+                digits += 1
+                if seen_dot:
+                    scale *= 10.0
+            elif c == 44 and not seen_dot:
+                pass
+            elif c == 46 and not seen_dot:
+                seen_dot = True
+            elif c == 45 and j == 0:
+                sign = -1.0
+            else:
+                return False
+        if digits:
+            out[i] = sign * value / scale
+        elif length == 0:
+            out[i] = np.nan
+        else:
+            return False
+    return True
+
+def _compile_parse_money():
+    """
+    Compiles _parse_money_kernel with numba, or returns None without it.
+
+    The machine code is cached on disk beside this file. When the module
+    was exec'd from source there is no file to cache beside, so the kernel
+    is compiled per process instead.
+    """
+    if njit is None:
+        return None
+    try:
+        return njit(cache=True)(_parse_money_kernel)
+    except RuntimeError:
+        return njit(_parse_money_kernel)
+
+parse_money = _compile_parse_money()
+
+def _to_amount_compiled(series: pd.Series):
+    """
+    Converts amount cells with the compiled parse_money kernel.
+
+    Returns:
+        A float64 array, or None if a cell is too wide, not ASCII, or not a
+        plain amount, in which case pandas should be used.
+    """
+    cells = series.fillna('').to_numpy(dtype=str)
+    if cells.dtype.itemsize // 4 > MONEY_WIDTH:
+        return None
+    try:
+        buf = cells.astype(f"S{MONEY_WIDTH}").view(np.uint8).reshape(len(cells), MONEY_WIDTH)
+    except UnicodeEncodeError:
+        return None
+
+    out = np.empty(len(cells), dtype=np.float64)
+    return out if parse_money(buf, out) else None
+
+def _to_amount(series: pd.Series) -> pd.Series:
+    """
+    Converts a column of amount cells to float64 in one vectorized pass.
+
+    Uses the compiled parse_money kernel when numba is installed. Otherwise
+    thousands separators are stripped first; if any cell is still not a
+    valid number, falls back to coercing invalid cells to NaN.
+    """
+    if parse_money is not None:
+        values = _to_amount_compiled(series)
+        if values is not None:
+            return pd.Series(values, index=series.index)
+
+    cleaned = series.str.replace(',', '', regex=False)
+    try:
+        return cleaned.astype('float64')
+    except ValueError:
+        return pd.to_numeric(cleaned, errors='coerce')
+
+def _transaction_rows(tables):
+    """
+    Selects the transaction rows of one page's tables.
+
+    Returns:
+        A 2-D object array holding the raw cells of the expected columns, in
+        EXPECTED_COLUMNS order. Tables without the expected header are skipped.
+    """
+    table_rows = []
+    for table in tables:
+        if table and len(table) > 1:
+            # Assuming the first row is the header
+            header = table[0]
+            data_rows = table[1:]
+
+            # Clean up header to match expected column names
+            cleaned_header = [h.strip() if h else '' for h in header]
+            
+            # Map extracted data to expected columns
+            # This assumes a consistent order of columns in the PDF
+            # If the order can vary, more robust mapping would be needed.
+            
+            # If header names don't match exactly, skip the table
+            # For this specific problem, we assume exact matches based on the example.
+            if not EXPECTED_HEADER.issubset(cleaned_header):
+                continue
+
+            # Find the index of each expected column with a single header lookup table;
+            # a repeated header name maps to its first column, as list.index() would
+            header_map = {}
+            for i, h in enumerate(cleaned_header):
+                header_map.setdefault(h, i)
+            column_idxs = [header_map[col] for col in EXPECTED_COLUMNS]
+
+            # map() binds this table's getter now; cells are fetched when the rows are flattened
+            max_idx = max(column_idxs)
+            complete_rows = [row for row in data_rows if len(row) > max_idx]
+            table_rows.append(map(itemgetter(*column_idxs), complete_rows))
+
+    # Flatten every table's rows in one pass and build a single array
+    rows = list(chain.from_iterable(table_rows))
+    if not rows:
+        return np.empty((0, len(EXPECTED_COLUMNS)), dtype=object)
+    return np.array(rows, dtype=object)
+
+# Handles from the table backend shared across calls in this process, least
+# recently used first: {pdf_path: (mtime_ns, pid, pdf, lock)}
+MAX_OPEN_PDFS = 4
+_open_pdfs = OrderedDict()
+_open_pdfs_lock = threading.Lock()
+
+def _checkout_pdf(pdf_path: str):
+    """
+    Returns the shared handle entry for this PDF, reopening it if the file
+    has been modified since it was cached. The pid is part of the entry so
+    forked workers never read through a file offset shared with the parent.
+
+    Handles superseded by a newer file version or evicted from the cache
+    are closed once no caller is using them.
+    """
+    version = (os.stat(pdf_path).st_mtime_ns, os.getpid())
+    stale = []
+    with _open_pdfs_lock:
+        entry = _open_pdfs.get(pdf_path)
+        if entry is not None and entry[:2] == version:
+            _open_pdfs.move_to_end(pdf_path)
+            return entry
+
+        if entry is not None and entry[1] == version[1]:
+            stale.append(entry)
+        entry = version + (table_backend.open(pdf_path), threading.Lock())
+        _open_pdfs[pdf_path] = entry
+        _open_pdfs.move_to_end(pdf_path)
+        while len(_open_pdfs) > MAX_OPEN_PDFS:
+            _, evicted = _open_pdfs.popitem(last=False)
+            if evicted[1] == version[1]:
+                stale.append(evicted)
+
+    # Entries inherited from a parent process are dropped without closing
+    for _, _, pdf, lock in stale:
+        with lock:
+            pdf.close()
+    return entry
+
+@contextmanager
+def _shared_pdf(pdf_path: str):
+    """
+    Yields this process's shared handle for the PDF, holding its lock.
+    """
+    while True:
+        entry = _checkout_pdf(pdf_path)
+        with entry[3]:
+            # Retry if the handle was superseded while waiting for the lock
+            if _open_pdfs.get(pdf_path) is entry:
+                yield entry[2]
+                return
+
+def _extract_page_rows(pdf_path: str, page_num: int):
+    """
+    Extracts the transaction rows from a single page of the PDF.
+
+    Runs in a worker process, which keeps one handle from the configured
+    table backend for all its pages and only sends the selected cells back.
+    """
+    with _shared_pdf(pdf_path) as pdf:
+        page = pdf.pages[page_num]
+
+        # Statements carry one transaction table per page, so only the largest
+        # detected table is extracted
+        try:
+            table = page.extract_table(table_settings=TABLE_SETTINGS)
+        except TypeError:
+            # Rust ports only implement the default detection settings
+            table = page.extract_table()
+
+        # Drop the page's parsed objects; only the handle itself is worth keeping
+        if hasattr(page, "close"):
+            page.close()
+
+    return _transaction_rows([table] if table else [])
+
+def _workers_can_import():
+    """
+    Checks that pool workers can unpickle _extract_page_rows, which they
+    look up by this module's name.
+
+    Forked workers inherit sys.modules; other start methods re-import the
+    module from its file. Source exec'd into an unregistered namespace has
+    neither, so its pages must be extracted serially.
+    """
+    module = sys.modules.get(__name__)
+    if module is None or getattr(module, '_extract_page_rows', None) is not _extract_page_rows:
+        return False
+    if multiprocessing.get_start_method() == 'fork':
+        return True
+    try:
+        spec = importlib.util.find_spec(__name__)
+    except (ImportError, ValueError):
+        return False
+    return spec is not None and spec.origin is not None and spec.origin == globals().get('__file__')
+
+def _iter_page_rows(pdf_path: str):
+    """
+    Yields the transaction rows of each page, in page order.
+
+    Pages are extracted lazily, and the fast backends stop after MAX_ROWS
+    rows, so a consumer that stops early skips the remaining pages.
+    """
+    # PDFium's text layer is much faster than pdfminer; fall back if it misses rows
+    page_rows = _extract_rows_fast(pdf_path)
+
+    # Next best is PyMuPDF's compiled table finder, when installed
+    if page_rows is None and pymupdf is not None:
+        page_rows = _extract_rows_pymupdf(pdf_path)
+
+    if page_rows is not None:
+        yield from page_rows
+        return
+
+    with table_backend.open(pdf_path) as pdf:
+        num_pages = len(pdf.pages)
+
+    # Extract pages in parallel, batching pages per task on long statements;
+    # map() yields results in page order
+    extract_page = partial(_extract_page_rows, pdf_path)
+    if num_pages > 1 and _workers_can_import():
+        workers = min(os.cpu_count() or 1, num_pages)
+        chunksize = max(1, num_pages // (workers * 4))
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            yield from executor.map(extract_page, range(num_pages), chunksize=chunksize)
+        finally:
+            # Closing the generator early cancels the pages not yet started
+            executor.shutdown(cancel_futures=True)
+    else:
+        for page_num in range(num_pages):
+            yield extract_page(page_num)
+
+def _iter_rows(pdf_path: str):
+    """
+    Yields transaction rows one at a time across all pages.
+    """
+    pages = _iter_page_rows(pdf_path)
+    try:
+        yield from chain.from_iterable(pages)
+    finally:
+        pages.close()
+
+def _pdf_sha256(pdf_path: str) -> str:
+    """
+    Hashes the PDF contents in 1 MiB chunks.
+    """
+    sha = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+def _result_cache_path(pdf_path: str):
+    """
+    Returns the parquet cache file for this PDF, or None when caching is
+    disabled with ICICI_PARSER_NO_CACHE=1, the module has no source file to
+    fingerprint, or the PDF cannot be read.
+    """
+    if os.environ.get("ICICI_PARSER_NO_CACHE") == "1" or SOURCE_DIGEST is None:
+        return None
+    try:
+        return CACHE_DIR / f"{_pdf_sha256(pdf_path)}-{SOURCE_DIGEST}.parquet"
+    except OSError:
+        return None
+
+def _store_result(cache_path: Path, df: pd.DataFrame):
+    """
+    Writes a parsed result to the cache and removes entries for the same PDF
+    left by other versions of this module. Caching is best effort.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, cache_path)
+
+        pdf_sha = cache_path.name.split('-')[0]
+        for stale_path in cache_path.parent.glob(f"{pdf_sha}-*.parquet"):
+            if stale_path != cache_path:
+                stale_path.unlink(missing_ok=True)
+    except (ImportError, OSError, ValueError):
+        pass  # pyarrow may not be installed
+
 def parse(pdf_path: str) -> pd.DataFrame:
     """
     Parses a bank statement PDF to extract transaction data.
@@ -14,74 +600,47 @@ def parse(pdf_path: str) -> pd.DataFrame:
         with exactly 100 rows and columns: 'Date', 'Description',
         'Debit Amt', 'Credit Amt', 'Balance'.
     """
-    all_transactions = []
+    # Unchanged PDFs are served from the parquet cache
+    cache_path = _result_cache_path(pdf_path)
+    if cache_path is not None and cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except (ImportError, OSError, ValueError):
+            pass  # Unreadable or no parquet engine; parse again
+
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                tables = page.extract_tables()
-                for table in tables:
-                    if table and len(table) > 1:
-                        # Assuming the first row is the header
-                        header = table[0]
-                        data_rows = table[1:]
-
-                        # Clean up header to match expected column names
-                        cleaned_header = [h.strip() if h else '' for h in header]
-                        
-                        # Map extracted data to expected columns
-                        # This assumes a consistent order of columns in the PDF
-                        # If the order can vary, more robust mapping would be needed.
-                        
-                        # Find the index of each expected column
-                        try:
-                            date_idx = cleaned_header.index("Date")
-                            desc_idx = cleaned_header.index("Description")
-                            debit_idx = cleaned_header.index("Debit Amt")
-                            credit_idx = cleaned_header.index("Credit Amt")
-                            balance_idx = cleaned_header.index("Balance")
-                        except ValueError:
-                            # If header names don't match exactly, try common variations or skip
-                            # For this specific problem, we assume exact matches based on the example.
-                            continue 
-
-                        for row in data_rows:
-                            if len(row) > max(date_idx, desc_idx, debit_idx, credit_idx, balance_idx):
-                                transaction = {
-                                    "Date": row[date_idx].strip() if row[date_idx] else None,
-                                    "Description": row[desc_idx].strip() if row[desc_idx] else None,
-                                    "Debit Amt": row[debit_idx].strip() if row[debit_idx] else None,
-                                    "Credit Amt": row[credit_idx].strip() if row[credit_idx] else None,
-                                    "Balance": row[balance_idx].strip() if row[balance_idx] else None,
-                                }
-                                all_transactions.append(transaction)
-    except Exception as e:
-        print(f"Error processing PDF: {e}")
+        # Rows are consumed lazily; closing the generator once MAX_ROWS are read
+        # stops any page extraction still pending
+        rows = _iter_rows(pdf_path)
+        try:
+            df = pd.DataFrame.from_records(rows, columns=EXPECTED_COLUMNS, nrows=MAX_ROWS)
+        finally:
+            rows.close()
+    except PDF_ERRORS:
+        logger.exception("Error processing PDF %s", pdf_path)
         return pd.DataFrame()
 
-    if not all_transactions:
+    if df.empty:
         return pd.DataFrame()
 
-    df = pd.DataFrame(all_transactions)
+    # Pin the text columns to the string dtype, even when a column is all None,
+    # so .str.strip runs in Arrow's kernels
+    df = df.astype({col: TEXT_DTYPE for col in TEXT_COLUMNS})
 
-    # Clean and convert data types
-    df['Debit Amt'] = pd.to_numeric(df['Debit Amt'], errors='coerce')
-    df['Credit Amt'] = pd.to_numeric(df['Credit Amt'], errors='coerce')
-    df['Balance'] = pd.to_numeric(df['Balance'], errors='coerce')
+    # Strip whitespace column-wise, then treat empty cells as missing
+    columns = {col: df[col].str.strip().replace('', np.nan) for col in TEXT_COLUMNS}
 
-    # Replace empty strings with NaN for consistency
-    df.replace('', np.nan, inplace=True)
+    # Stack the amount cells into one column so they are cleaned and converted in a single pass
+    amounts = pd.concat([df[col] for col in AMOUNT_COLUMNS], ignore_index=True)
+    amounts = _to_amount(amounts.str.strip().replace('', np.nan))
+    for col, values in zip(AMOUNT_COLUMNS, amounts.to_numpy().reshape(len(AMOUNT_COLUMNS), -1)):
+        columns[col] = pd.Series(values, index=df.index)
 
-    # Ensure exactly 100 rows
-    if len(df) > 100:
-        df = df.head(100)
-    elif len(df) < 100:
-        # Pad with NaN if fewer than 100 rows are found
-        padding = pd.DataFrame(np.nan, index=range(100 - len(df)), columns=df.columns)
-        df = pd.concat([df, padding], ignore_index=True)
+    # Build the output once, in column order and padded to exactly MAX_ROWS rows with NaN
+    df = pd.DataFrame(columns, index=range(MAX_ROWS), columns=EXPECTED_COLUMNS)
 
-    # Ensure the correct column order
-    expected_columns = ['Date', 'Description', 'Debit Amt', 'Credit Amt', 'Balance']
-    df = df[expected_columns]
+    if cache_path is not None:
+        _store_result(cache_path, df)
 
     return df
 
@@ -94,154 +653,153 @@ if __name__ == '__main__':
     # Create a dummy PDF file for testing purposes
     # In a real scenario, you would have an actual PDF file.
     try:
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.pagesizes import letter
+        data_page1 = [
+            ["01-08-2024", "Salary Credit XYZ Pvt Ltd", "1935.3", "", "6864.58"],
+            ["02-08-2024", "Salary Credit XYZ Pvt Ltd", "", "1652.61", "8517.19"],
+            ["03-08-2024", "IMPS UPI Payment Amazon", "3886.08", "", "4631.11"],
+            ["03-08-2024", "Mobile Recharge Via UPI", "", "1648.72", "6279.83"],
+            ["14-08-2024", "Fuel Purchase Debit Card", "", "3878.57", "10158.4"],
+            ["17-08-2024", "Electricity Bill NEFT Online", "", "1963.11", "12121.51"],
+            ["18-08-2024", "Interest Credit Saving Account", "596.72", "", "11524.79"],
+            ["25-08-2024", "Cheque Deposit Local Clearing", "617.86", "", "10906.93"],
+            ["27-08-2024", "Fuel Purchase Debit Card", "", "2650.96", "13557.89"],
+            ["01-09-2024", "Dining Out Card Swipe", "", "656.42", "14214.31"],
+            ["08-09-2024", "Mobile Recharge Via UPI", "4150.96", "", "10063.35"],
+            ["12-09-2024", "Cheque Deposit Local Clearing", "", "826.71", "10890.06"],
+            ["16-09-2024", "Fuel Purchase Debit Card", "", "3148.44", "14038.5"],
+            ["16-09-2024", "Credit Card Payment ICICI", "1629.34", "", "12409.16"],
+            ["20-09-2024", "NEFT Transfer To ABC Ltd", "", "4275.77", "16684.93"],
+            ["25-09-2024", "Salary Credit XYZ Pvt Ltd", "", "2507.17", "19192.1"],
+            ["26-09-2024", "IMPS UPI Payment Amazon", "", "740.64", "19932.74"],
+            ["03-10-2024", "EMI Auto Debit HDFC Bank", "", "2516.44", "22449.18"],
+            ["06-10-2024", "Utility Bill Payment Electricity", "4208.51", "", "18240.67"],
+            ["07-10-2024", "Service Charge GST Debit", "", "3593.89", "21834.56"],
+            ["09-10-2024", "Cash Deposit Branch Counter", "", "3215.04", "25049.6"],
+            ["12-10-2024", "IMPS UPI Payment Amazon", "", "4098.72", "29148.32"],
+            ["15-10-2024", "UPI QR Payment Groceries", "3713.69", "", "25434.63"],
+            ["22-10-2024", "Salary Credit XYZ Pvt Ltd", "4182.2", "", "21252.43"],
+            ["23-10-2024", "UPI QR Payment Groceries", "3615.84", "", "17636.59"],
+            ["26-10-2024", "EMI Auto Debit HDFC Bank", "1006.21", "", "16630.38"],
+            ["04-11-2024", "Service Charge GST Debit", "756.93", "", "15873.45"],
+            ["04-11-2024", "Cash Deposit Branch Counter", "", "622.18", "16495.63"],
+            ["06-11-2024", "Cash Deposit Branch Counter", "3777.56", "", "12718.07"],
+            ["07-11-2024", "Fuel Purchase Debit Card", "2986.0", "", "9732.07"],
+            ["11-11-2024", "UPI QR Payment Groceries", "", "3116.44", "12848.51"],
+            ["14-11-2024", "Utility Bill Payment Electricity", "320.12", "", "12528.39"],
+            ["14-11-2024", "Electricity Bill NEFT Online", "", "3079.38", "15607.77"],
+            ["19-11-2024", "NEFT Transfer To ABC Ltd", "4925.74", "", "10682.03"],
+            ["21-11-2024", "Cheque Deposit Local Clearing", "", "515.93", "11197.96"],
+            ["26-11-2024", "Fuel Purchase Debit Card", "", "4319.32", "15517.28"],
+            ["01-12-2024", "Fuel Purchase Debit Card", "", "821.75", "16339.03"],
+            ["04-12-2024", "Cheque Deposit Local Clearing", "2939.04", "", "13399.99"],
+            ["07-12-2024", "Dining Out Card Swipe", "", "2177.58", "15577.57"],
+            ["13-12-2024", "Cash Deposit Branch Counter", "1210.14", "", "14367.43"],
+            ["17-12-2024", "IMPS UPI Payment Amazon", "", "1683.84", "16051.27"],
+            ["18-12-2024", "Cash Deposit Branch Counter", "4706.8", "", "11344.47"],
+            ["24-12-2024", "Cheque Deposit Local Clearing", "", "1359.0", "12703.47"],
+            ["27-12-2024", "NEFT Transfer From PQR Pvt", "4678.02", "", "8025.45"],
+            ["01-01-2025", "UPI QR Payment Groceries", "", "2447.81", "10473.26"],
+            ["05-01-2025", "UPI QR Payment Groceries", "270.87", "", "10202.39"],
+            ["15-01-2025", "NEFT Transfer From PQR Pvt", "3782.46", "", "6419.93"],
+            ["23-01-2025", "Credit Card Payment ICICI", "", "426.36", "6846.29"],
+            ["27-01-2025", "Service Charge GST Debit", "4332.26", "", "2514.03"],
+            ["27-01-2025", "Fuel Purchase Debit Card", "", "1533.65", "4047.68"],
+        ]
+
+        data_page2 = [
+            ["30-01-2025", "UPI QR Payment Groceries", "", "4960.86", "9008.54"],
+            ["02-02-2025", "IMPS UPI Payment Amazon", "", "2693.97", "11702.51"],
+            ["14-02-2025", "Online Card Purchase Flipkart", "", "737.74", "12440.25"],
+            ["21-02-2025", "Dining Out Card Swipe", "3973.65", "", "8466.6"],
+            ["24-02-2025", "IMPS UPI Payment Amazon", "", "1998.34", "10464.94"],
+            ["24-02-2025", "Salary Credit XYZ Pvt Ltd", "", "1611.68", "12076.62"],
+            ["01-03-2025", "Credit Card Payment ICICI", "4509.03", "", "7567.59"],
+            ["02-03-2025", "Dining Out Card Swipe", "", "2922.99", "10490.58"],
+            ["10-03-2025", "Interest Credit Saving Account", "", "187.17", "10677.75"],
+            ["12-03-2025", "IMPS UPI Payment Amazon", "741.32", "", "9936.43"],
+            ["13-03-2025", "Insurance Premium Auto Debit", "", "2881.87", "12818.3"],
+            ["18-03-2025", "Interest Credit Saving Account", "884.31", "", "11933.99"],
+            ["21-03-2025", "ATM Cash Withdrawal India", "189.74", "", "11744.25"],
+            ["31-03-2025", "Insurance Premium Auto Debit", "3183.71", "", "8560.54"],
+            ["01-04-2025", "Dining Out Card Swipe", "1786.81", "", "6773.73"],
+            ["10-04-2025", "Fuel Purchase Debit Card", "", "3455.33", "10229.06"],
+            ["10-04-2025", "Salary Credit XYZ Pvt Ltd", "3130.96", "", "7098.1"],
+            ["12-04-2025", "Insurance Premium Auto Debit", "827.09", "", "6271.01"],
+            ["16-04-2025", "Dining Out Card Swipe", "", "4890.35", "11161.36"],
+            ["19-04-2025", "Online Card Purchase Flipkart", "2634.0", "", "8527.36"],
+            ["22-04-2025", "Credit Card Payment ICICI", "", "4168.32", "12695.68"],
+            ["25-04-2025", "Salary Credit XYZ Pvt Ltd", "", "4183.97", "16879.65"],
+            ["27-04-2025", "IMPS UPI Transfer Paytm", "4087.04", "", "12792.61"],
+            ["28-04-2025", "IMPS UPI Transfer Paytm", "363.47", "", "12429.14"],
+            ["05-05-2025", "NEFT Transfer From PQR Pvt", "", "22.16", "12451.3"],
+            ["17-05-2025", "Salary Credit XYZ Pvt Ltd", "1863.31", "", "10587.99"],
+            ["21-05-2025", "Fuel Purchase Debit Card", "4526.6", "", "6061.39"],
+            ["31-05-2025", "Dining Out Card Swipe", "2583.14", "", "3478.25"],
+            ["01-06-2025", "Salary Credit XYZ Pvt Ltd", "4044.7", "", "-566.45"],
+            ["01-06-2025", "Salary Credit XYZ Pvt Ltd", "2617.5", "", "-3183.95"],
+            ["07-06-2025", "Dining Out Card Swipe", "", "3077.91", "-106.04"],
+            ["08-06-2025", "Electricity Bill NEFT Online", "", "3949.78", "3843.74"],
+            ["10-06-2025", "Utility Bill Payment Electricity", "4567.77", "", "-724.03"],
+            ["18-06-2025", "Utility Bill Payment Electricity", "1980.53", "", "-2704.56"],
+            ["18-06-2025", "Interest Credit Saving Account", "", "4805.82", "2101.26"],
+            ["21-06-2025", "Electricity Bill NEFT Online", "", "395.05", "2496.31"],
+            ["26-06-2025", "Online Card Purchase Flipkart", "", "1263.09", "3759.4"],
+            ["27-06-2025", "ATM Cash Withdrawal India", "4944.55", "", "-1185.15"],
+            ["30-06-2025", "Interest Credit Saving Account", "150.91", "", "-1336.06"],
+            ["05-07-2025", "IMPS UPI Payment Amazon", "", "4883.29", "3547.23"],
+            ["06-07-2025", "Interest Credit Saving Account", "1248.14", "", "2299.09"],
+            ["08-07-2025", "Online Card Purchase Flipkart", "4029.62", "", "-1730.53"],
+            ["14-07-2025", "Mobile Recharge Via UPI", "380.91", "", "-2111.44"],
+            ["16-07-2025", "ATM Cash Withdrawal India", "", "4630.04", "2518.6"],
+            ["19-07-2025", "NEFT Transfer From PQR Pvt", "1581.69", "", "936.91"],
+            ["20-07-2025", "Utility Bill Payment Electricity", "", "2989.23", "3926.14"],
+            ["23-07-2025", "Salary Credit XYZ Pvt Ltd", "", "2988.46", "6914.6"],
+            ["24-07-2025", "Electricity Bill NEFT Online", "2917.52", "", "3997.08"],
+            ["25-07-2025", "Salary Credit XYZ Pvt Ltd", "566.32", "", "3430.76"],
+            ["27-07-2025", "ATM Cash Withdrawal India", "", "2156.01", "5586.77"],
+        ]
 
         def create_dummy_pdf(filename="bank_statement.pdf"):
+            from reportlab.pdfgen import canvas
+            from reportlab.lib.pagesizes import letter
+
             c = canvas.Canvas(filename, pagesize=letter)
             width, height = letter
 
+            def start_page(title):
+                c.drawString(100, height - 50, title)
+                c.drawString(100, height - 70, "Date Description Debit Amt Credit Amt Balance")
+                return c.beginText(), height - 90
+
+            def draw_rows(rows):
+                # Each page's cells go into one text object rather than a drawString call per cell
+                text, y_position = start_page("ChatGPT Powered Karbon Bannk")
+                for row in rows:
+                    for i, item in enumerate(row):
+                        text.setTextOrigin(100 + i * 100, y_position)
+                        text.textOut(item)
+                    y_position -= 15
+                    if y_position < 100: # Move to next page if needed
+                        c.drawText(text)
+                        c.showPage()
+                        text, y_position = start_page("ChatGPT Powered Karbon Bannk (cont.)")
+                c.drawText(text)
+
             # Page 1
-            c.drawString(100, height - 50, "ChatGPT Powered Karbon Bannk")
-            c.drawString(100, height - 70, "Date Description Debit Amt Credit Amt Balance")
-
-            y_position = height - 90
-            data_page1 = [
-                ["01-08-2024", "Salary Credit XYZ Pvt Ltd", "1935.3", "", "6864.58"],
-                ["02-08-2024", "Salary Credit XYZ Pvt Ltd", "", "1652.61", "8517.19"],
-                ["03-08-2024", "IMPS UPI Payment Amazon", "3886.08", "", "4631.11"],
-                ["03-08-2024", "Mobile Recharge Via UPI", "", "1648.72", "6279.83"],
-                ["14-08-2024", "Fuel Purchase Debit Card", "", "3878.57", "10158.4"],
-                ["17-08-2024", "Electricity Bill NEFT Online", "", "1963.11", "12121.51"],
-                ["18-08-2024", "Interest Credit Saving Account", "596.72", "", "11524.79"],
-                ["25-08-2024", "Cheque Deposit Local Clearing", "617.86", "", "10906.93"],
-                ["27-08-2024", "Fuel Purchase Debit Card", "", "2650.96", "13557.89"],
-                ["01-09-2024", "Dining Out Card Swipe", "", "656.42", "14214.31"],
-                ["08-09-2024", "Mobile Recharge Via UPI", "4150.96", "", "10063.35"],
-                ["12-09-2024", "Cheque Deposit Local Clearing", "", "826.71", "10890.06"],
-                ["16-09-2024", "Fuel Purchase Debit Card", "", "3148.44", "14038.5"],
-                ["16-09-2024", "Credit Card Payment ICICI", "1629.34", "", "12409.16"],
-                ["20-09-2024", "NEFT Transfer To ABC Ltd", "", "4275.77", "16684.93"],
-                ["25-09-2024", "Salary Credit XYZ Pvt Ltd", "", "2507.17", "19192.1"],
-                ["26-09-2024", "IMPS UPI Payment Amazon", "", "740.64", "19932.74"],
-                ["03-10-2024", "EMI Auto Debit HDFC Bank", "", "2516.44", "22449.18"],
-                ["06-10-2024", "Utility Bill Payment Electricity", "4208.51", "", "18240.67"],
-                ["07-10-2024", "Service Charge GST Debit", "", "3593.89", "21834.56"],
-                ["09-10-2024", "Cash Deposit Branch Counter", "", "3215.04", "25049.6"],
-                ["12-10-2024", "IMPS UPI Payment Amazon", "", "4098.72", "29148.32"],
-                ["15-10-2024", "UPI QR Payment Groceries", "3713.69", "", "25434.63"],
-                ["22-10-2024", "Salary Credit XYZ Pvt Ltd", "4182.2", "", "21252.43"],
-                ["23-10-2024", "UPI QR Payment Groceries", "3615.84", "", "17636.59"],
-                ["26-10-2024", "EMI Auto Debit HDFC Bank", "1006.21", "", "16630.38"],
-                ["04-11-2024", "Service Charge GST Debit", "756.93", "", "15873.45"],
-                ["04-11-2024", "Cash Deposit Branch Counter", "", "622.18", "16495.63"],
-                ["06-11-2024", "Cash Deposit Branch Counter", "3777.56", "", "12718.07"],
-                ["07-11-2024", "Fuel Purchase Debit Card", "2986.0", "", "9732.07"],
-                ["11-11-2024", "UPI QR Payment Groceries", "", "3116.44", "12848.51"],
-                ["14-11-2024", "Utility Bill Payment Electricity", "320.12", "", "12528.39"],
-                ["14-11-2024", "Electricity Bill NEFT Online", "", "3079.38", "15607.77"],
-                ["19-11-2024", "NEFT Transfer To ABC Ltd", "4925.74", "", "10682.03"],
-                ["21-11-2024", "Cheque Deposit Local Clearing", "", "515.93", "11197.96"],
-                ["26-11-2024", "Fuel Purchase Debit Card", "", "4319.32", "15517.28"],
-                ["01-12-2024", "Fuel Purchase Debit Card", "", "821.75", "16339.03"],
-                ["04-12-2024", "Cheque Deposit Local Clearing", "2939.04", "", "13399.99"],
-                ["07-12-2024", "Dining Out Card Swipe", "", "2177.58", "15577.57"],
-                ["13-12-2024", "Cash Deposit Branch Counter", "1210.14", "", "14367.43"],
-                ["17-12-2024", "IMPS UPI Payment Amazon", "", "1683.84", "16051.27"],
-                ["18-12-2024", "Cash Deposit Branch Counter", "4706.8", "", "11344.47"],
-                ["24-12-2024", "Cheque Deposit Local Clearing", "", "1359.0", "12703.47"],
-                ["27-12-2024", "NEFT Transfer From PQR Pvt", "4678.02", "", "8025.45"],
-                ["01-01-2025", "UPI QR Payment Groceries", "", "2447.81", "10473.26"],
-                ["05-01-2025", "UPI QR Payment Groceries", "270.87", "", "10202.39"],
-                ["15-01-2025", "NEFT Transfer From PQR Pvt", "3782.46", "", "6419.93"],
-                ["23-01-2025", "Credit Card Payment ICICI", "", "426.36", "6846.29"],
-                ["27-01-2025", "Service Charge GST Debit", "4332.26", "", "2514.03"],
-                ["27-01-2025", "Fuel Purchase Debit Card", "", "1533.65", "4047.68"],
-            ]
-            for row in data_page1:
-                for i, item in enumerate(row):
-                    c.drawString(100 + i * 100, y_position, item)
-                y_position -= 15
-                if y_position < 100: # Move to next page if needed
-                    c.showPage()
-                    c.drawString(100, height - 50, "ChatGPT Powered Karbon Bannk (cont.)")
-                    c.drawString(100, height - 70, "Date Description Debit Amt Credit Amt Balance")
-                    y_position = height - 90
+            draw_rows(data_page1)
 
             # Page 2
             c.showPage()
-            c.drawString(100, height - 50, "ChatGPT Powered Karbon Bannk")
-            c.drawString(100, height - 70, "Date Description Debit Amt Credit Amt Balance")
-
-            y_position = height - 90
-            data_page2 = [
-                ["30-01-2025", "UPI QR Payment Groceries", "", "4960.86", "9008.54"],
-                ["02-02-2025", "IMPS UPI Payment Amazon", "", "2693.97", "11702.51"],
-                ["14-02-2025", "Online Card Purchase Flipkart", "", "737.74", "12440.25"],
-                ["21-02-2025", "Dining Out Card Swipe", "3973.65", "", "8466.6"],
-                ["24-02-2025", "IMPS UPI Payment Amazon", "", "1998.34", "10464.94"],
-                ["24-02-2025", "Salary Credit XYZ Pvt Ltd", "", "1611.68", "12076.62"],
-                ["01-03-2025", "Credit Card Payment ICICI", "4509.03", "", "7567.59"],
-                ["02-03-2025", "Dining Out Card Swipe", "", "2922.99", "10490.58"],
-                ["10-03-2025", "Interest Credit Saving Account", "", "187.17", "10677.75"],
-                ["12-03-2025", "IMPS UPI Payment Amazon", "741.32", "", "9936.43"],
-                ["13-03-2025", "Insurance Premium Auto Debit", "", "2881.87", "12818.3"],
-                ["18-03-2025", "Interest Credit Saving Account", "884.31", "", "11933.99"],
-                ["21-03-2025", "ATM Cash Withdrawal India", "189.74", "", "11744.25"],
-                ["31-03-2025", "Insurance Premium Auto Debit", "3183.71", "", "8560.54"],
-                ["01-04-2025", "Dining Out Card Swipe", "1786.81", "", "6773.73"],
-                ["10-04-2025", "Fuel Purchase Debit Card", "", "3455.33", "10229.06"],
-                ["10-04-2025", "Salary Credit XYZ Pvt Ltd", "3130.96", "", "7098.1"],
-                ["12-04-2025", "Insurance Premium Auto Debit", "827.09", "", "6271.01"],
-                ["16-04-2025", "Dining Out Card Swipe", "", "4890.35", "11161.36"],
-                ["19-04-2025", "Online Card Purchase Flipkart", "2634.0", "", "8527.36"],
-                ["22-04-2025", "Credit Card Payment ICICI", "", "4168.32", "12695.68"],
-                ["25-04-2025", "Salary Credit XYZ Pvt Ltd", "", "4183.97", "16879.65"],
-                ["27-04-2025", "IMPS UPI Transfer Paytm", "4087.04", "", "12792.61"],
-                ["28-04-2025", "IMPS UPI Transfer Paytm", "363.47", "", "12429.14"],
-                ["05-05-2025", "NEFT Transfer From PQR Pvt", "", "22.16", "12451.3"],
-                ["17-05-2025", "Salary Credit XYZ Pvt Ltd", "1863.31", "", "10587.99"],
-                ["21-05-2025", "Fuel Purchase Debit Card", "4526.6", "", "6061.39"],
-                ["31-05-2025", "Dining Out Card Swipe", "2583.14", "", "3478.25"],
-                ["01-06-2025", "Salary Credit XYZ Pvt Ltd", "4044.7", "", "-566.45"],
-                ["01-06-2025", "Salary Credit XYZ Pvt Ltd", "2617.5", "", "-3183.95"],
-                ["07-06-2025", "Dining Out Card Swipe", "", "3077.91", "-106.04"],
-                ["08-06-2025", "Electricity Bill NEFT Online", "", "3949.78", "3843.74"],
-                ["10-06-2025", "Utility Bill Payment Electricity", "4567.77", "", "-724.03"],
-                ["18-06-2025", "Utility Bill Payment Electricity", "1980.53", "", "-2704.56"],
-                ["18-06-2025", "Interest Credit Saving Account", "", "4805.82", "2101.26"],
-                ["21-06-2025", "Electricity Bill NEFT Online", "", "395.05", "2496.31"],
-                ["26-06-2025", "Online Card Purchase Flipkart", "", "1263.09", "3759.4"],
-                ["27-06-2025", "ATM Cash Withdrawal India", "4944.55", "", "-1185.15"],
-                ["30-06-2025", "Interest Credit Saving Account", "150.91", "", "-1336.06"],
-                ["05-07-2025", "IMPS UPI Payment Amazon", "", "4883.29", "3547.23"],
-                ["06-07-2025", "Interest Credit Saving Account", "1248.14", "", "2299.09"],
-                ["08-07-2025", "Online Card Purchase Flipkart", "4029.62", "", "-1730.53"],
-                ["14-07-2025", "Mobile Recharge Via UPI", "380.91", "", "-2111.44"],
-                ["16-07-2025", "ATM Cash Withdrawal India", "", "4630.04", "2518.6"],
-                ["19-07-2025", "NEFT Transfer From PQR Pvt", "1581.69", "", "936.91"],
-                ["20-07-2025", "Utility Bill Payment Electricity", "", "2989.23", "3926.14"],
-                ["23-07-2025", "Salary Credit XYZ Pvt Ltd", "", "2988.46", "6914.6"],
-                ["24-07-2025", "Electricity Bill NEFT Online", "2917.52", "", "3997.08"],
-                ["25-07-2025", "Salary Credit XYZ Pvt Ltd", "566.32", "", "3430.76"],
-                ["27-07-2025", "ATM Cash Withdrawal India", "", "2156.01", "5586.77"],
-            ]
-            for row in data_page2:
-                for i, item in enumerate(row):
-                    c.drawString(100 + i * 100, y_position, item)
-                y_position -= 15
-                if y_position < 100:
-                    c.showPage()
-                    c.drawString(100, height - 50, "ChatGPT Powered Karbon Bannk (cont.)")
-                    c.drawString(100, height - 70, "Date Description Debit Amt Credit Amt Balance")
-                    y_position = height - 90
+            draw_rows(data_page2)
 
             c.save()
             print(f"Dummy PDF '{filename}' created.")
 
-        dummy_pdf_path = "bank_statement.pdf"
-        create_dummy_pdf(dummy_pdf_path)
-
+        # The fixture is deterministic, so it is only generated once per data version
+        data_hash = hashlib.blake2b(repr(data_page1 + data_page2).encode()).hexdigest()[:12]
+        dummy_pdf_path = f"bank_statement_{data_hash}.pdf"
+        if not os.path.exists(dummy_pdf_path):
+            create_dummy_pdf(dummy_pdf_path)
         # Now call the parse function with the dummy PDF
         parsed_df = parse(dummy_pdf_path)
 
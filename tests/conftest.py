@@ -0,0 +1,42 @@
+"""
+Shared fixtures for the PDF Parser Agent tests
+"""
+
+import pytest
+
+STATEMENT_HEADER = ['Date', 'Description', 'Debit Amt', 'Credit Amt', 'Balance']
+COLUMN_EDGES = [40, 120, 330, 420, 510, 590]
+LINE_HEIGHT = 12
+
+@pytest.fixture(autouse=True)
+def no_result_cache(monkeypatch):
+    """Keep parse() from reading or writing the user's result cache"""
+    monkeypatch.setenv("ICICI_PARSER_NO_CACHE", "1")
+
+@pytest.fixture
+def ruled_statement(tmp_path):
+    """Build a one-page ruled statement PDF; a list cell is drawn as wrapped lines"""
+    canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+    from reportlab.lib.pagesizes import letter
+    
+    def build(rows, header=STATEMENT_HEADER, name="statement.pdf"):
+        path = tmp_path / name
+        c = canvas.Canvas(str(path), pagesize=letter)
+        y = letter[1] - 60
+        
+        for cells in [header] + rows:
+            lines = [cell if isinstance(cell, list) else [cell] for cell in cells]
+            height = 6 + LINE_HEIGHT * max(len(cell_lines) for cell_lines in lines)
+            
+            c.rect(COLUMN_EDGES[0], y - height, COLUMN_EDGES[-1] - COLUMN_EDGES[0], height)
+            for x in COLUMN_EDGES[1:-1]:
+                c.line(x, y, x, y - height)
+            for x, cell_lines in zip(COLUMN_EDGES, lines):
+                for k, text in enumerate(cell_lines):
+                    c.drawString(x + 3, y - LINE_HEIGHT * (k + 1), text)
+            y -= height
+        
+        c.save()
+        return str(path)
+    
+    return build
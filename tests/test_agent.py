@@ -6,12 +6,14 @@ Test file for the PDF Parser Agent
 import pytest
 import os
 import sys
+import asyncio
 from pathlib import Path
+from types import SimpleNamespace
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from agent import PDFParserAgent, AgentState
+from agent import PDFParserAgent, AgentState, TEMPLATES, MIN_CONTEXT_CACHE_TOKENS
 
 class TestPDFParserAgent:
     """Test cases for PDFParserAgent"""
@@ -44,6 +46,20 @@ class TestPDFParserAgent:
         assert 'text_content' in structure
         assert len(structure['text_content']) > 0
     
+    def test_pdf_structure_wrapped_cell(self, ruled_statement):
+        """Test that a wrapped cell falls back to pdfplumber and keeps every line"""
+        agent = PDFParserAgent()
+        pdf_path = ruled_statement([
+            ["01-08-2024", "Salary Credit XYZ Pvt Ltd", "", "1935.3", "6864.58"],
+            ["02-08-2024", ["NEFT Transfer From A Very Long", "Private Limited Ref 123"], "1652.61", "", "5211.97"],
+            ["03-08-2024", "IMPS UPI Payment Amazon", "3886.08", "", "1325.89"],
+        ])
+        
+        assert agent._extract_pdf_structure_fast(pdf_path) is None
+        
+        structure = agent._extract_pdf_structure(pdf_path)
+        assert structure['tables'][0]['data'][2][1] == "NEFT Transfer From A Very Long\nPrivate Limited Ref 123"
+    
     def test_csv_structure_analysis(self):
         """Test CSV structure analysis"""
         agent = PDFParserAgent()
@@ -112,5 +128,209 @@ class TestPDFParserAgent:
         state['attempt_count'] = 1
         assert agent._should_continue(state) == "continue"
 
+    def test_prompts_use_cached_context(self):
+        """Test that prompts only inline the PDF structure without a context cache"""
+        agent = PDFParserAgent()
+        
+        state = AgentState(
+            target_bank="test",
+            pdf_path="test.pdf",
+            csv_path="test.csv",
+            pdf_structure={
+                'tables': [],
+                'text_content': ["UNIQUE_PAGE_TEXT"],
+                'expected_output': {
+                    'columns': ['Date'],
+                    'data_types': {'Date': 'object'},
+                    'sample_data': [],
+                    'total_rows': 0
+                }
+            },
+            parser_code="def parse(pdf_path): pass",
+            test_results={'error': "boom"},
+            attempt_count=1,
+            max_attempts=3,
+            error_messages=[],
+            success=False,
+            cache_name=None
+        )
+        assert "UNIQUE_PAGE_TEXT" in agent._create_parser_prompt(state).content
+        
+        # The early exit may leave later pages unread; the prompt still counts every page
+        state['pdf_structure']['num_pages'] = 10
+        assert "The PDF has 10 pages." in agent._create_parser_prompt(state).content
+        assert "UNIQUE_PAGE_TEXT" in agent._create_fix_prompt(state).content
+        
+        state['cache_name'] = "cachedContents/test"
+        assert "UNIQUE_PAGE_TEXT" not in agent._create_parser_prompt(state).content
+        fix_prompt = agent._create_fix_prompt(state).content
+        assert "UNIQUE_PAGE_TEXT" not in fix_prompt
+        assert "boom" in fix_prompt
+
+    def _fake_cache_client(self, agent, total_tokens):
+        """Replace the LLM with an async Gemini client stub that records its calls"""
+        calls = []
+        
+        async def count_tokens(model, contents):
+            calls.append('count_tokens')
+            return SimpleNamespace(total_tokens=total_tokens)
+        
+        async def create(model, config):
+            calls.append('create')
+            return SimpleNamespace(name="cachedContents/test")
+        
+        async def delete(name):
+            calls.append(f"delete {name}")
+        
+        agent.llm = SimpleNamespace(client=SimpleNamespace(aio=SimpleNamespace(
+            models=SimpleNamespace(count_tokens=count_tokens),
+            caches=SimpleNamespace(create=create, delete=delete)
+        )))
+        agent._compact_structure = lambda structure: structure
+        return calls
+    
+    def test_context_cache_minimum_size(self):
+        """Test that content below Gemini's minimum cacheable size is never uploaded"""
+        agent = PDFParserAgent()
+        calls = self._fake_cache_client(agent, MIN_CONTEXT_CACHE_TOKENS - 1)
+        
+        # Small enough to skip without counting tokens
+        assert asyncio.run(agent._create_context_cache({'text': "x"})) is None
+        assert calls == []
+        
+        structure = {'text': "x" * 2000}
+        assert asyncio.run(agent._create_context_cache(structure)) is None
+        assert calls == ['count_tokens']
+        
+        calls = self._fake_cache_client(agent, MIN_CONTEXT_CACHE_TOKENS)
+        assert asyncio.run(agent._create_context_cache(structure)) == "cachedContents/test"
+        assert calls == ['count_tokens', 'create']
+        assert agent.context_caches == ["cachedContents/test"]
+    
+    def test_context_cache_released_on_failure(self):
+        """Test that the context cache is deleted even when the workflow raises"""
+        agent = PDFParserAgent()
+        calls = self._fake_cache_client(agent, MIN_CONTEXT_CACHE_TOKENS)
+        
+        class FailingWorkflow:
+            async def ainvoke(self, state):
+                await agent._create_context_cache({'text': "x" * 2000})
+                raise RuntimeError("node failed")
+        
+        agent.workflow = FailingWorkflow()
+        with pytest.raises(RuntimeError):
+            asyncio.run(agent._run_workflow({}))
+        
+        assert calls == ['count_tokens', 'create', "delete cachedContents/test"]
+        assert agent.context_caches == []
+    
+    def test_compact_structure(self):
+        """Test that the prompt projection keeps headers and samples only"""
+        agent = PDFParserAgent()
+        
+        header = ['Date', 'Description', 'Balance']
+        rows = [[f"{day:02d}-01-2025", "Payment", str(day)] for day in range(1, 21)]
+        structure = {
+            'tables': agent._dedupe_tables([
+                {'page': 0, 'data': [header] + rows[:10], 'headers': header},
+                {'page': 1, 'data': [header] + rows[10:], 'headers': header}
+            ]),
+            'text_content': [None, "y" * 2000]
+        }
+        
+        assert structure['tables'][1] == {'page': 1, 'data_ref': 0, 'rows': rows[10:]}
+        
+        compact = agent._compact_structure(structure)
+        
+        assert compact['num_pages'] == 2
+        assert compact['table_headers'] == [header]
+        assert compact['sample_rows'] == rows[:3]
+        assert compact['text_excerpt'] == "y" * 500
+    
+    def test_parser_cache_roundtrip(self, tmp_path):
+        """Test parser cache store and lookup keyed on file contents"""
+        agent = PDFParserAgent()
+        agent.cache_path = tmp_path / "parsers.sqlite"
+        
+        pdf_path = tmp_path / "statement.pdf"
+        csv_path = tmp_path / "result.csv"
+        pdf_path.write_bytes(b"%PDF-1.4 fake")
+        csv_path.write_text("Date\n01-01-2025\n")
+        
+        assert agent._cache_lookup(str(pdf_path), str(csv_path)) is None
+        
+        agent._cache_store(str(pdf_path), str(csv_path), "def parse(pdf_path): pass")
+        assert agent._cache_lookup(str(pdf_path), str(csv_path)) == "def parse(pdf_path): pass"
+        
+        # Changing the expected output invalidates the entry
+        csv_path.write_text("Date\n02-01-2025\n")
+        assert agent._cache_lookup(str(pdf_path), str(csv_path)) is None
+
+    def test_validate_parser(self):
+        """Test parser validation against the expected CSV"""
+        agent = PDFParserAgent()
+        pdf_path = "data/icici/icici sample.pdf"
+        csv_path = "data/icici/result.csv"
+        
+        if not os.path.exists(pdf_path) or not os.path.exists(csv_path):
+            pytest.skip("ICICI sample data not found")
+        
+        parser_code = Path("custom_parsers/icici_parser.py").read_text()
+        assert agent._validate_parser(parser_code, pdf_path, csv_path)['success']
+        
+        missing_columns = "import pandas as pd\ndef parse(pdf_path):\n    return pd.DataFrame(columns=['Date'])\n"
+        result = agent._validate_parser(missing_columns, pdf_path, csv_path)
+        assert not result['success']
+        assert "not referenced" in result['error']
+        
+        wrong_order = (
+            "import pandas as pd\n"
+            "def parse(pdf_path):\n"
+            "    return pd.DataFrame(columns=['Balance', 'Credit Amt', 'Debit Amt', 'Description', 'Date'])\n"
+        )
+        result = agent._validate_parser(wrong_order, pdf_path, csv_path)
+        assert not result['success']
+        assert "Column mismatch" in result['error']
+
+    def test_template_skips_llm(self):
+        """Test that a known column layout uses its template without calling the LLM"""
+        agent = PDFParserAgent()
+        agent.llm = None  # Any LLM call would fail
+        
+        columns = ['Date', 'Description', 'Debit Amt', 'Credit Amt', 'Balance']
+        state = AgentState(
+            target_bank="icici",
+            pdf_path="test.pdf",
+            csv_path="test.csv",
+            pdf_structure={'expected_output': {'columns': columns}},
+            parser_code="",
+            test_results={},
+            attempt_count=0,
+            max_attempts=3,
+            error_messages=[],
+            success=False,
+            cache_name=None
+        )
+        state = asyncio.run(agent._generate_parser_node(state))
+        
+        assert state['error_messages'] == []
+        assert state['parser_code'] == TEMPLATES[tuple(sorted(columns))].read_text()
+        assert not state.get('context_cache_checked')
+    
+    def test_validate_template_pdfplumber_fallback(self):
+        """Test that the template's pdfplumber worker pool runs under validation"""
+        agent = PDFParserAgent()
+        pdf_path = "data/icici/icici sample.pdf"
+        csv_path = "data/icici/result.csv"
+        
+        if not os.path.exists(pdf_path) or not os.path.exists(csv_path):
+            pytest.skip("ICICI sample data not found")
+        
+        # Disable the PDFium and PyMuPDF paths so parse() reaches the process pool
+        parser_code = Path("custom_parsers/icici_parser.py").read_text() + (
+            "\n_extract_rows_fast = lambda pdf_path: None\npymupdf = None\n"
+        )
+        assert agent._validate_parser(parser_code, pdf_path, csv_path) == {'success': True, 'error': None}
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Test file for the ICICI template parser
+"""
+
+import pytest
+import os
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from custom_parsers import icici_parser
+
+WRAPPED_ROWS = [
+    ["01-08-2024", "Salary Credit XYZ Pvt Ltd", "", "1935.3", "6864.58"],
+    ["02-08-2024", ["NEFT Transfer From A Very Long", "Private Limited Ref 123"], "1652.61", "", "5211.97"],
+    ["03-08-2024", "IMPS UPI Payment Amazon", "3886.08", "", "1325.89"],
+]
+
+SAMPLE_PDF = "data/icici/icici sample.pdf"
+
+@pytest.fixture
+def result_cache(monkeypatch, tmp_path):
+    """Enable the result cache in a temporary directory"""
+    pytest.importorskip("pyarrow")
+    if not Path(SAMPLE_PDF).exists():
+        pytest.skip(f"PDF file not found: {SAMPLE_PDF}")
+    monkeypatch.delenv("ICICI_PARSER_NO_CACHE")
+    monkeypatch.setattr(icici_parser, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+class TestICICIParser:
+    """Test cases for the ICICI parser"""
+
+    def test_wrapped_cell_falls_back(self, ruled_statement):
+        """Test that a wrapped cell sends the page to pdfplumber instead of losing a line"""
+        pdf_path = ruled_statement(WRAPPED_ROWS)
+
+        assert icici_parser._extract_rows_fast(pdf_path) is None
+
+        df = icici_parser.parse(pdf_path)
+        assert df['Description'].iloc[1] == "NEFT Transfer From A Very Long\nPrivate Limited Ref 123"
+        assert df['Debit Amt'].iloc[1] == 1652.61
+        assert df['Date'].notna().sum() == 3
+
+    def test_wrapped_last_row_falls_back(self, ruled_statement):
+        """Test that a continuation line below the last row is detected"""
+        pdf_path = ruled_statement(WRAPPED_ROWS[:1] + WRAPPED_ROWS[2:] + WRAPPED_ROWS[1:2])
+
+        assert icici_parser._extract_rows_fast(pdf_path) is None
+
+    def test_unmatched_header_falls_back(self, ruled_statement):
+        """Test that dated rows under an unrecognised header are not silently dropped"""
+        header = ['Txn Date', 'Description', 'Debit Amt', 'Credit Amt', 'Balance']
+        pdf_path = ruled_statement(WRAPPED_ROWS[:1], header=header)
+
+        assert icici_parser._extract_rows_fast(pdf_path) is None
+
+    def test_unwrapped_rows_use_fast_path(self, ruled_statement):
+        """Test that single-line rows are still rebuilt from the PDFium text layer"""
+        pdf_path = ruled_statement([WRAPPED_ROWS[0], WRAPPED_ROWS[2]])
+
+        page_rows = icici_parser._extract_rows_fast(pdf_path)
+        assert page_rows is not None
+        assert page_rows[0].tolist() == [WRAPPED_ROWS[0], WRAPPED_ROWS[2]]
+
+    def test_repeated_header_uses_first_column(self):
+        """Test that a repeated header name maps to its first column"""
+        header = ['Date', 'Description', 'Debit Amt', 'Credit Amt', 'Balance', 'Date']
+        rows = [
+            ["01-08-2024", "Salary Credit", "", "1935.3", "6864.58", "VALUE-DATE"],
+            ["02-08-2024", "NEFT Transfer", "1652.61", "", "5211.97"],
+        ]
+
+        assert icici_parser._transaction_rows([[header] + rows]).tolist() == [
+            ["01-08-2024", "Salary Credit", "", "1935.3", "6864.58"],
+            ["02-08-2024", "NEFT Transfer", "1652.61", "", "5211.97"],
+        ]
+
+    def test_parse_money_kernel(self, monkeypatch):
+        """Test the amount kernel's parsing rules as plain Python"""
+        monkeypatch.setattr(icici_parser, "parse_money", icici_parser._parse_money_kernel)
+        cells = pd.Series(["1,935.30", "-566.45", None, "0.1", "12"])
+
+        values = icici_parser._to_amount_compiled(cells)
+        assert values[[0, 1, 3, 4]].tolist() == [1935.3, -566.45, 0.1, 12.0]
+        assert pd.isna(values[2])
+
+        # Anything but a plain amount is left to pandas
+        assert icici_parser._to_amount_compiled(pd.Series(["1e5"])) is None
+        assert icici_parser._to_amount_compiled(pd.Series(["-"])) is None
+        assert icici_parser._to_amount_compiled(pd.Series(["1" * 20])) is None
+
+    def test_parse_money_compiled(self):
+        """Test that the numba kernel matches the pandas conversion"""
+        pytest.importorskip("numba")
+        cells = pd.Series(["1,935.30", "-566.45", None, "4960.86", "22.16"])
+
+        assert icici_parser.parse_money is not None
+        expected = pd.to_numeric(cells.str.replace(',', '', regex=False), errors='coerce')
+        assert icici_parser._to_amount(cells).equals(expected)
+
+    def test_parse_money_exec_from_source(self):
+        """Test that the parser compiles its kernel when exec'd without a backing file"""
+        pytest.importorskip("numba")
+        source = Path(icici_parser.__file__).read_text()
+        namespace = {'__name__': 'exec_parser'}
+
+        exec(compile(source, "<parser>", "exec"), namespace)
+        assert namespace['parse_money'] is not None
+
+    def test_unregistered_source_extracts_serially(self):
+        """Test that source exec'd outside sys.modules skips the worker pool"""
+        pdf_path = "data/icici/icici sample.pdf"
+        if not Path(pdf_path).exists():
+            pytest.skip(f"PDF file not found: {pdf_path}")
+
+        namespace = {'__name__': 'unregistered_parser'}
+        exec(compile(Path(icici_parser.__file__).read_text(), "<parser>", "exec"), namespace)
+        namespace['_extract_rows_fast'] = lambda pdf_path: None
+        namespace['pymupdf'] = None
+
+        assert not namespace['_workers_can_import']()
+        assert namespace['parse'](pdf_path)['Date'].notna().sum() == 100
+
+    def test_pymupdf_errors_are_logged(self, monkeypatch, caplog):
+        """Test that unreadable PDFs fall back with a warning while bugs still raise"""
+        if icici_parser.pymupdf is None:
+            pytest.skip("PyMuPDF not installed")
+
+        def unreadable(pdf_path):
+            raise icici_parser.pymupdf.FileDataError("broken")
+
+        monkeypatch.setattr(icici_parser.pymupdf, "open", unreadable)
+        assert icici_parser._extract_rows_pymupdf("statement.pdf") is None
+        assert "PyMuPDF could not read statement.pdf" in caplog.text
+
+        def buggy(pdf_path):
+            raise TypeError("bug")
+
+        monkeypatch.setattr(icici_parser.pymupdf, "open", buggy)
+        with pytest.raises(TypeError):
+            icici_parser._extract_rows_pymupdf("statement.pdf")
+
+    def test_result_cache_hit(self, result_cache, monkeypatch):
+        """Test that a second parse of the same PDF is served from the cache"""
+        df = icici_parser.parse(SAMPLE_PDF)
+        assert len(list(result_cache.glob("*.parquet"))) == 1
+
+        def no_extraction(pdf_path):
+            raise AssertionError("cached result was not used")
+
+        monkeypatch.setattr(icici_parser, "_iter_rows", no_extraction)
+        pd.testing.assert_frame_equal(icici_parser.parse(SAMPLE_PDF), df)
+
+    def test_result_cache_disabled(self, result_cache, monkeypatch):
+        """Test that ICICI_PARSER_NO_CACHE=1 leaves the cache untouched"""
+        monkeypatch.setenv("ICICI_PARSER_NO_CACHE", "1")
+
+        assert icici_parser.parse(SAMPLE_PDF)['Date'].notna().sum() == 100
+        assert list(result_cache.iterdir()) == []
+
+    def test_result_cache_stale_entry(self, result_cache):
+        """Test that results cached by another parser version are ignored and pruned"""
+        cache_path = icici_parser._result_cache_path(SAMPLE_PDF)
+        stale_path = cache_path.with_name(cache_path.name.replace(icici_parser.SOURCE_DIGEST, "0" * 16))
+        pd.DataFrame({'Date': ["stale"]}).to_parquet(stale_path)
+
+        df = icici_parser.parse(SAMPLE_PDF)
+        assert df['Date'].notna().sum() == 100
+        assert list(result_cache.glob("*.parquet")) == [cache_path]
+
+    def test_result_cache_skipped_for_exec_source(self, result_cache):
+        """Test that source exec'd without a file has no digest and is not cached"""
+        namespace = {'__name__': 'exec_parser'}
+        exec(compile(Path(icici_parser.__file__).read_text(), "<parser>", "exec"), namespace)
+
+        assert namespace['SOURCE_DIGEST'] is None
+        assert namespace['_result_cache_path'](SAMPLE_PDF) is None
+
+    def test_shared_pdf_handles_are_closed(self, ruled_statement, monkeypatch):
+        """Test that cached handles are closed when superseded by a newer file or evicted"""
+        monkeypatch.setattr(icici_parser, "_open_pdfs", OrderedDict())
+        monkeypatch.setattr(icici_parser, "MAX_OPEN_PDFS", 1)
+        pdf_path = ruled_statement(WRAPPED_ROWS)
+
+        assert len(icici_parser._extract_page_rows(pdf_path, 0)) == 3
+        first = icici_parser._open_pdfs[pdf_path][2]
+        assert not first.stream.closed
+
+        stat = os.stat(pdf_path)
+        os.utime(pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        icici_parser._extract_page_rows(pdf_path, 0)
+        second = icici_parser._open_pdfs[pdf_path][2]
+        assert first.stream.closed
+        assert not second.stream.closed
+
+        other_path = ruled_statement(WRAPPED_ROWS[:1], name="other.pdf")
+        icici_parser._extract_page_rows(other_path, 0)
+        assert second.stream.closed
+        assert list(icici_parser._open_pdfs) == [other_path]